@@ -1,11 +1,11 @@
-from src.config.config_manager import ConfigManager
+from src.config.config_manager import get_config_manager
 from src.core.formatter import WordFormatter
 from src.core.document import Document
 
 def main():
     try:
         # 加载配置
-        config_manager = ConfigManager()
+        config_manager = get_config_manager()
         
         # 读取测试文档
         doc = Document("./test/test.docx")
@@ -1,22 +1,25 @@
 # -*- coding: utf-8 -*-
 import sys
-import os
 from pathlib import Path
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QIcon
-from src.gui.main_window import MainWindow
+
+# 项目根目录及图标目录
+HERE = Path(__file__).resolve().parent
+ICON_DIR = HERE / "src" / "resources" / "icons"
 
 if __name__ == '__main__':
-    # 添加项目根目录到Python路径
-    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    # 在导入项目模块之前把项目根目录加入Python路径
+    if str(HERE) not in sys.path:
+        sys.path.insert(0, str(HERE))
     
     app = QApplication(sys.argv)
     
     # 设置应用图标
-    icon_path = Path(__file__).parent / "src" / "resources" / "icons" / "icon.ico"
+    icon_path = ICON_DIR / "icon.ico"
     if not icon_path.exists():
         # 尝试使用 app_icon.ico 作为备选
-        backup_icon_path = Path(__file__).parent / "src" / "resources" / "icons" / "app_icon.ico"
+        backup_icon_path = ICON_DIR / "app_icon.ico"
         if backup_icon_path.exists():
             icon_path = backup_icon_path
         else:
@@ -31,8 +34,7 @@ if __name__ == '__main__':
                 import traceback
                 traceback.print_exc()
     
-    window = MainWindow()
-    
+    # 图标只加载一次，设置为应用图标后所有窗口都会沿用
     if icon_path.exists():
         try:
             icon = QIcon(str(icon_path))
@@ -40,7 +42,6 @@ if __name__ == '__main__':
                 print("警告：图标加载失败 - 图标对象为空")
             else:
                 app.setWindowIcon(icon)
-                window.setWindowIcon(icon)
                 print(f"成功设置图标：{icon_path}")
         except Exception as e:
             print(f"设置图标失败：{e}")
@@ -49,5 +50,8 @@ if __name__ == '__main__':
     else:
         print(f"错误：图标文件不存在：{icon_path}")
     
+    # QApplication 创建之后再导入主窗口，页面及其依赖在此时才加载
+    from src.gui.main_window import MainWindow
+    window = MainWindow()
     window.show()
     sys.exit(app.exec()) 
\ No newline at end of file
@@ -1,11 +1,65 @@
-import json
+import copy
+import os
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+from ..utils import json_io
+
+# 默认格式模板的绝对路径
+_DEFAULT_TEMPLATE_PATH = str(Path(__file__).resolve().parent.parent / "core" / "presets" / "default.yaml")
+
+# 配置文件结构定义，仅在设置了 W0RDF0RMAT_VALIDATE_CONFIG 环境变量时用于校验
+_CONFIG_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "ai_assistant": {
+            "type": "object",
+            "properties": {
+                "enabled": {"type": "boolean"},
+                "model": {"type": "string"},
+            },
+        },
+        "formatting": {
+            "type": "object",
+            "properties": {
+                "use_default_template": {"type": "boolean"},
+                "template_path": {"type": ["string", "null"]},
+                "user_template_path": {"type": ["string", "null"]},
+            },
+        },
+        "format_presets": {"type": "object"},
+        "last_directory": {"type": "string"},
+    },
+}
+
+
+@lru_cache(maxsize=1)
+def _get_config_validator():
+    """
+    获取预编译的配置校验器，整个进程只构建一次
+    未开启校验或未安装jsonschema时返回None
+    """
+    if not os.getenv('W0RDF0RMAT_VALIDATE_CONFIG'):
+        return None
+    try:
+        import jsonschema
+    except ImportError:
+        print("警告：已开启配置校验但未安装jsonschema")
+        return None
+    return jsonschema.Draft202012Validator(_CONFIG_SCHEMA)
 
 class ConfigManager:
+    # 已解析的配置缓存，键为 (配置文件路径, 修改时间)，避免重复读取和解析
+    # 缓存中保存的是独立的副本，各实例修改自己的配置不会影响缓存，保存失败时缓存仍与文件一致
+    _config_cache: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
     def __init__(self):
         self.config_file = Path.home() / '.w0rdF0rmat' / 'config.json'
         self.config = self._load_config()
+        # 批量更新状态：嵌套层数及是否有未写入的修改
+        self._batch_depth = 0
+        self._dirty = False
 
     def _load_config(self):
         """加载配置文件"""
@@ -15,8 +69,14 @@ class ConfigManager:
             
             # 如果配置文件存在，则加载它
             if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                cache_key = (str(self.config_file), self.config_file.stat().st_mtime_ns)
+                cached = self._config_cache.get(cache_key)
+                if cached is not None:
+                    return copy.deepcopy(cached)
+                
+                config = json_io.loads(self.config_file.read_bytes())
+                self._config_cache[cache_key] = copy.deepcopy(config)
+                return config
             
             # 如果配置文件不存在，返回默认配置
             return {}
@@ -31,21 +91,69 @@ class ConfigManager:
             # 确保配置目录存在
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
             
-            # 保存配置
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, ensure_ascii=False, indent=4)
+            # 先写入临时文件再替换，避免写入中断导致配置文件损坏
+            tmp_file = self.config_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'wb') as f:
+                f.write(json_io.dumps(self.config))
+            os.replace(tmp_file, self.config_file)
+            
+            self._dirty = False
+            self._refresh_cache()
                 
         except Exception as e:
             print(f"保存配置文件失败: {str(e)}")
 
+    def _refresh_cache(self):
+        """写入后丢弃该文件的旧缓存，并以新的修改时间缓存当前配置的副本"""
+        path = str(self.config_file)
+        for key in [k for k in self._config_cache if k[0] == path]:
+            del self._config_cache[key]
+        self._config_cache[(path, self.config_file.stat().st_mtime_ns)] = copy.deepcopy(self.config)
+
     def get(self, key, default=None):
         """获取配置值"""
         return self.config.get(key, default)
 
     def set(self, key, value):
         """设置配置值"""
+        # 先校验修改后的配置副本，校验失败时配置保持不变
+        validator = _get_config_validator()
+        if validator is not None:
+            validator.validate({**self.config, key: value})
         self.config[key] = value
-        self._save_config()
+        self._dirty = True
+        if self._batch_depth == 0:
+            self._save_config()
+
+    def update(self, values: Dict[str, Any]):
+        """一次性设置多个配置值，只写入一次文件"""
+        with self.batch():
+            for key, value in values.items():
+                self.set(key, value)
+
+    @contextmanager
+    def batch(self):
+        """
+        批量修改配置，上下文正常退出时才写入文件
+        上下文中抛出异常时，撤销进入上下文之后的所有修改，不写入文件
+        用法：
+            with config_manager.batch():
+                config_manager.set('a', 1)
+                config_manager.set('b', 2)
+        """
+        snapshot = copy.deepcopy(self.config)
+        dirty = self._dirty
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self.config = snapshot
+            self._dirty = dirty
+            raise
+        finally:
+            self._batch_depth -= 1
+        if self._batch_depth == 0 and self._dirty:
+            self._save_config()
 
     def get_format_presets(self):
         """获取格式预设"""
@@ -53,7 +161,8 @@ class ConfigManager:
 
     def save_format_preset(self, name, preset):
         """保存格式预设"""
-        presets = self.get_format_presets()
+        # 通过 set 修改，新的预设与其他配置一样先经过校验
+        presets = dict(self.get_format_presets())
         presets[name] = preset
         self.set('format_presets', presets)
 
@@ -61,8 +170,7 @@ class ConfigManager:
         """删除格式预设"""
         presets = self.get_format_presets()
         if name in presets:
-            del presets[name]
-            self.set('format_presets', presets)
+            self.set('format_presets', {k: v for k, v in presets.items() if k != name})
     
     def save_user_template(self, template: Dict[str, Any], project_path: str) -> str:
         """
@@ -78,12 +186,13 @@ class ConfigManager:
             # 确保目录存在
             template_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(template_path, 'w', encoding='utf-8') as f:
-                json.dump(template, f, indent=2, ensure_ascii=False)
+            with open(template_path, 'wb') as f:
+                f.write(json_io.dumps(template))
             
             # 更新配置
-            self.config.setdefault("formatting", {})["user_template_path"] = str(template_path)
-            self._save_config()
+            formatting = dict(self.config.get("formatting", {}))
+            formatting["user_template_path"] = str(template_path)
+            self.set("formatting", formatting)
             
             return str(template_path)
         except Exception as e:
@@ -91,27 +200,28 @@ class ConfigManager:
             return None
     
     def save_config(self):
-        """保存配置到文件"""
-        try:
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(self.config, f, allow_unicode=True)
-        except Exception as e:
-            print(f"保存配置文件失败: {str(e)}")
+        """保存配置到文件（统一使用JSON格式）"""
+        self._save_config()
     
     def is_ai_enabled(self) -> bool:
         """检查是否启用AI功能"""
-        return self.config["ai_assistant"]["enabled"]
+        return self.config.get("ai_assistant", {}).get("enabled", False)
     
     def get_ai_model(self) -> str:
         """获取AI模型名称"""
-        return self.config["ai_assistant"]["model"]
+        return self.config.get("ai_assistant", {}).get("model", "gpt-3.5-turbo")
     
     def get_template_path(self) -> str:
         """获取当前使用的模板路径"""
-        if not self.config["formatting"]["use_default_template"] and \
-           self.config["formatting"]["user_template_path"]:
-            return self.config["formatting"]["user_template_path"]
+        formatting = self.config.get("formatting", {})
+        if not formatting.get("use_default_template", True) and \
+           formatting.get("user_template_path"):
+            return formatting["user_template_path"]
         
-        # 使用绝对路径
-        default_path = Path(__file__).parent.parent / "core" / "presets" / "default.yaml"
-        return str(default_path) 
\ No newline at end of file
+        return _DEFAULT_TEMPLATE_PATH
+
+
+@lru_cache(maxsize=None)
+def get_config_manager() -> ConfigManager:
+    """获取进程内共享的配置管理器实例，配置文件只读取一次"""
+    return ConfigManager()
@@ -1,11 +1,47 @@
 import os
-from openai import OpenAI
-from dotenv import load_dotenv
 import json
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional, Dict, Any
 from ..config.config_manager import ConfigManager
+from ..utils import json_io
+
+# AI分析结果的磁盘缓存目录
+_CACHE_DIR = Path.home() / '.w0rdF0rmat' / 'ai_cache'
+# AI分析结果内存缓存的最大条目数，更早的结果仍可从磁盘缓存读取
+_ANALYSIS_CACHE_SIZE = 64
+
+# .env文件是否已加载
+_env_loaded = False
+
+
+def _load_env():
+    """加载.env文件，整个进程只加载一次"""
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _env_loaded = True
+
+
+@lru_cache(maxsize=4)
+def _get_client(api_key: str):
+    """
+    获取该API密钥对应的共享OpenAI客户端，避免每个实例都重新创建HTTP连接池
+    密钥变化后会创建新的客户端
+    """
+    # 仅在启用AI时才导入OpenAI SDK，避免拖慢启动
+    from openai import OpenAI
+    return OpenAI(api_key=api_key)
+
 
 class DocumentAI:
+    # AI分析结果的内存缓存，键为模型与文档内容的哈希
+    # 按最近使用顺序排列，超过 _ANALYSIS_CACHE_SIZE 条时丢弃最久未用的结果
+    _analysis_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
     def __init__(self, config_manager: ConfigManager):
         """
         初始化DocumentAI
@@ -22,13 +58,13 @@ class DocumentAI:
     def _initialize_ai(self):
         """初始化AI相关配置"""
         try:
-            load_dotenv()
+            _load_env()
             self.api_key = os.getenv('OPENAI_API_KEY')
             if not self.api_key:
                 print("警告：AI功能已启用但未找到OPENAI_API_KEY环境变量")
                 return
             
-            self.client = OpenAI(api_key=self.api_key)
+            self.client = _get_client(self.api_key)
             self.model = self.config_manager.get_ai_model()
         except Exception as e:
             print(f"AI初始化失败: {str(e)}")
@@ -53,6 +89,12 @@ class DocumentAI:
         """
         if not self._check_ai_available():
             return None
+        
+        # 相同内容的文档直接使用缓存结果
+        cache_key = self._cache_key(text)
+        cached = self._load_cached_analysis(cache_key)
+        if cached is not None:
+            return cached
             
         prompt = """
         请分析以下学术论文内容，识别并返回以下部分：
@@ -95,12 +137,60 @@ class DocumentAI:
                 max_tokens=2000
             )
             
-            result = json.loads(response.choices[0].message.content)
+            result = json_io.loads(response.choices[0].message.content)
+            self._store_cached_analysis(cache_key, result)
             return result
         except Exception as e:
             print(f"AI分析出错: {str(e)}")
             return None
     
+    def _cache_key(self, text: str) -> str:
+        """根据模型和文档内容计算缓存键"""
+        content = f"{self.model}\n{text}".encode('utf-8')
+        return hashlib.blake2b(content, digest_size=16).hexdigest()
+    
+    def _load_cached_analysis(self, key: str) -> Optional[Dict[str, Any]]:
+        """先查内存缓存，再查磁盘缓存"""
+        cache = self._analysis_cache
+        result = cache.get(key)
+        if result is not None:
+            cache.move_to_end(key)
+            return result
+        
+        cache_file = _CACHE_DIR / f"{key}.json"
+        try:
+            if cache_file.exists():
+                result = json_io.loads(cache_file.read_bytes())
+                self._remember_analysis(key, result)
+                return result
+        except ValueError:
+            # 缓存文件损坏时视为未命中，删除后重新分析
+            cache_file.unlink(missing_ok=True)
+        except Exception as e:
+            print(f"读取AI缓存失败: {str(e)}")
+        return None
+    
+    def _remember_analysis(self, key: str, result: Dict[str, Any]):
+        """将分析结果放入内存缓存，超出容量时丢弃最久未用的结果"""
+        cache = self._analysis_cache
+        cache[key] = result
+        cache.move_to_end(key)
+        if len(cache) > _ANALYSIS_CACHE_SIZE:
+            cache.popitem(last=False)
+    
+    def _store_cached_analysis(self, key: str, result: Dict[str, Any]):
+        """将分析结果写入内存和磁盘缓存"""
+        self._remember_analysis(key, result)
+        try:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # 先写入临时文件再替换，崩溃或多个进程同时写入时不会留下不完整的缓存文件
+            cache_file = _CACHE_DIR / f"{key}.json"
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            tmp_file.write_bytes(json_io.dumps(result))
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            print(f"写入AI缓存失败: {str(e)}")
+    
     def suggest_formatting(self, section_type: str, content: str) -> Optional[Dict[str, Any]]:
         """
         为特定类型的内容提供格式建议
@@ -160,7 +250,7 @@ class DocumentAI:
                 temperature=0.3
             )
             
-            result = json.loads(response.choices[0].message.content)
+            result = json_io.loads(response.choices[0].message.content)
             return result
         except Exception as e:
             print(f"格式建议生成失败: {str(e)}")
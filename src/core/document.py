@@ -2,111 +2,275 @@ from docx import Document as DocxDocument
 from docx.shared import Pt, Inches
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
 from docx.enum.style import WD_STYLE_TYPE
-from .ai_assistant import DocumentAI
+from docx.oxml.ns import qn
+from docx.text.paragraph import Paragraph
+import io
 import json
+import re
+from collections import OrderedDict
 from typing import Dict, Any
 
+# 段落样式分类
+_STYLE_OTHER, _STYLE_TITLE, _STYLE_ABSTRACT, _STYLE_KEYWORDS, _STYLE_HEADING1 = range(5)
+
+# 摘要、关键词段落的开头，忽略大小写匹配，不必先把整段文本转为小写
+_ABSTRACT_KEYWORDS_RE = re.compile(r'(?P<abstract>abstract|摘要)|(?P<keywords>keywords|关键词)', re.IGNORECASE)
+
+# 章节标题：以数字编号（如 "1."）或中文数字编号（如 "一、"）开头，或包含特定的标题关键词
+_SECTION_HEADING_RE = re.compile(
+    r'^(?:[1-9]\.|[一二三四五六七八九]、)'
+    r'|引言|介绍|研究方法|实验|结果|讨论|结论|参考文献'
+)
+
+# 一级章节标题：以数字编号（如 "1. 引言"）、中文数字编号（如 "一、引言"）或特定的一级标题关键词开头
+_MAIN_SECTION_HEADING_RE = re.compile(
+    r'[1-9]\. |[一二三四五六七八九]、'
+    r'|引言|介绍|研究背景|理论基础|研究方法|实验方法|结果分析|实验结果|讨论|结论|参考文献'
+)
+
+# WordprocessingML 段落、run及run内文本节点的限定名
+_W_P = qn('w:p')
+_W_R = qn('w:r')
+_W_HYPERLINK = qn('w:hyperlink')
+_W_T = qn('w:t')
+_W_BR = qn('w:br')
+_W_TYPE = qn('w:type')
+# run中除 w:t、w:br 外对应固定文本的节点，与 python-docx 的 Run.text 一致
+_RUN_CHILD_TEXT = {
+    qn('w:tab'): '\t',
+    qn('w:ptab'): '\t',
+    qn('w:cr'): '\n',
+    qn('w:noBreakHyphen'): '-',
+}
+
+# 发送给AI分析的最大字符数，超出部分会被模型上下文截断
+_AI_MAX_CHARS = 60_000
+# AI格式建议缓存的最大条目数
+_SUGGESTION_CACHE_SIZE = 128
+
+def _classify_style_name(style_name: str) -> int:
+    """根据小写的样式名称判断段落样式属于文档的哪一部分"""
+    if 'title' in style_name or '标题' in style_name:
+        return _STYLE_TITLE
+    if 'abstract' in style_name or '摘要' in style_name:
+        return _STYLE_ABSTRACT
+    if 'keywords' in style_name or '关键词' in style_name:
+        return _STYLE_KEYWORDS
+    if 'heading 1' in style_name or '标题 1' in style_name:
+        return _STYLE_HEADING1
+    return _STYLE_OTHER
+
+def paragraph_text(p) -> str:
+    """
+    读取 w:p 元素的文本，结果与 Paragraph.text 相同
+    只读取段落自身的run（包括超链接中的run），不读取文本框等嵌套内容中的文本；
+    w:tab 转为制表符，换行（w:br、w:cr）转为换行符
+    """
+    parts = []
+    append = parts.append
+    for child in p.iterchildren(_W_R, _W_HYPERLINK):
+        runs = (child,) if child.tag == _W_R else child.iterchildren(_W_R)
+        for r in runs:
+            for e in r.iterchildren():
+                tag = e.tag
+                if tag == _W_T:
+                    append(e.text or '')
+                elif tag == _W_BR:
+                    # 分页符、分栏符不计入文本
+                    if e.get(_W_TYPE, 'textWrapping') == 'textWrapping':
+                        append('\n')
+                else:
+                    text = _RUN_CHILD_TEXT.get(tag)
+                    if text is not None:
+                        append(text)
+    return ''.join(parts)
+
+def _is_reference_section(name: str) -> bool:
+    """判断章节名是否为参考文献章节"""
+    return '参考文献' in name or 'references' in name.lower()
+
 class Document:
+    # AI格式建议缓存，键为 (模型, 部分类型, 内容)，相同内容不再重复请求
+    # 按最近使用顺序排列，超过 _SUGGESTION_CACHE_SIZE 条时丢弃最久未用的建议
+    _suggestion_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+
     def __init__(self, path, config_manager=None):
         self.path = path
-        self.doc = DocxDocument(path)
+        # 一次性读入内存，之后需要原始文档时不再重复读取和解压文件
+        with open(path, 'rb') as f:
+            self._buf = io.BytesIO(f.read())
+        self.doc = DocxDocument(self._buf)
         self.config_manager = config_manager
         # 存储论文的各部分内容
         self.title = None
         self.abstract = None
         self.keywords = None
+        # 章节名 -> 段落缓存中的下标区间列表 [[start, end], ...]，需要时再取出段落
         self.sections = {}
+        # 解析时记录参考文献章节名，避免每次获取时扫描所有章节
+        self._reference_keys = []
         self.ai_assistant = None
+        # 各种解析方式共用的段落缓存，每个段落的文本和样式只读取一次
+        self._para_cache = self._build_paragraph_cache()
+        self._cached_paras = [entry[0] for entry in self._para_cache]
+        # 一级章节标题在段落缓存中的下标，首次添加分节符时计算
+        self._main_section_idx = None
+        
+        # 一次遍历同时按样式和文本规则解析文档结构
+        self._parse_unified()
         
-        # 先尝试通过文档样式来解析
-        if not self._parse_by_styles():
-            # 如果样式解析失败，试试使用传统方法
-            if not self._parse_document_traditional():
-                # 如果传统方法也失败，且AI功能已启用，则使用AI分析
-                if self.config_manager and self.config_manager.is_ai_enabled():
-                    self.ai_assistant = DocumentAI(self.config_manager)
-                    self._parse_with_ai()
-
-    def _parse_by_styles(self) -> bool:
+        # 本地解析未识别出任何章节时，若AI功能已启用，再使用AI分析
+        if not self.sections and self.config_manager and self.config_manager.is_ai_enabled():
+            self.ai_assistant = self._create_ai_assistant()
+            self._parse_with_ai()
+
+    def _create_ai_assistant(self):
+        """创建AI助手，延迟导入以免在未启用AI时加载OpenAI相关模块"""
+        from .ai_assistant import DocumentAI
+        return DocumentAI(self.config_manager)
+
+    def _build_paragraph_cache(self) -> list:
         """
-        通过文档现有样式解析文档结构
-        返回是否解析成功
+        缓存所有非空段落的 (段落, 去除首尾空白的文本, 样式分类)
+        直接遍历正文的 w:p 元素读取文本，只为非空段落创建Paragraph对象
         """
-        try:
-            styles = [s.name for s in self.doc.styles if s.type == WD_STYLE_TYPE.PARAGRAPH]
-            current_section = None
-            
-            for para in self.doc.paragraphs:
-                if not para.text.strip():
-                    continue
-                
-                style_name = para.style.name.lower()
-                
-                # 通过样式名称识别各部分
-                if 'title' in style_name or '标题' in style_name:
-                    if not self.title:  # 只取第一个标题
-                        self.title = para
-                elif 'abstract' in style_name or '摘要' in style_name:
-                    self.abstract = para
-                elif 'keywords' in style_name or '关键词' in style_name:
-                    self.keywords = para
-                elif 'heading 1' in style_name or '标题 1' in style_name:
-                    current_section = para.text.strip()
-                    self.sections[current_section] = []
-                elif current_section:
-                    self.sections[current_section].append(para)
-            
-            # 如果至少识别出标题和一个章节，则认为解析成功
-            return bool(self.title and self.sections)
-        except Exception as e:
-            print(f"样式解析出错: {str(e)}")
-            return False
+        categories, default_category = self._build_style_categories()
+        body = self.doc._body
+        cache = []
+        for p, text in self._iter_paragraph_texts():
+            text = text.strip()
+            if not text:
+                continue
+            # 直接读取段落的样式ID，不通过 para.style 查找样式对象
+            category = categories.get(p.style, default_category)
+            cache.append((Paragraph(p, body), text, category))
+        return cache
 
-    def _parse_document_traditional(self) -> bool:
+    def _build_style_categories(self):
         """
-        使用传统方法解析文档结构
-        返回是否解析成功
+        按样式ID对所有段落样式分类，每个样式只判断一次
+        返回 (样式ID到分类的映射, 默认段落样式的分类)
+        """
+        categories = {}
+        for style in self.doc.styles:
+            if style.type == WD_STYLE_TYPE.PARAGRAPH:
+                categories[style.style_id] = _classify_style_name((style.name or '').lower())
+        
+        default_style = self.doc.styles.default(WD_STYLE_TYPE.PARAGRAPH)
+        default_category = _STYLE_OTHER
+        if default_style is not None:
+            default_category = categories.get(default_style.style_id, _STYLE_OTHER)
+        return categories, default_category
+
+    def get_paragraph_cache(self) -> list:
+        """获取非空段落缓存，元素为 (段落, 文本, 样式分类)"""
+        return self._para_cache
+
+    def _parse_unified(self) -> bool:
+        """
+        一次遍历段落缓存，同时按样式和按文本规则识别文档结构
+        样式识别出标题和章节时采用样式结果，否则采用文本规则的结果
+        返回是否识别出文档结构
         """
         try:
-            current_section = None
-            found_structure = False
+            is_section_heading = self._is_section_heading
+            extend_ranges = self._extend_ranges
+            # 按样式识别的结果
+            style_title = style_abstract = style_keywords = None
+            style_sections = {}
+            style_ranges = None
+            # 按文本规则识别的结果
+            text_title = text_abstract = text_keywords = None
+            text_sections = {}
+            text_ranges = None
             
-            for para in self.doc.paragraphs:
-                text = para.text.strip()
-                if not text:
-                    continue
+            for i, (para, text, category) in enumerate(self._para_cache):
+                # 通过样式分类识别各部分
+                if category == _STYLE_TITLE:
+                    if style_title is None:  # 只取第一个标题
+                        style_title = para
+                elif category == _STYLE_ABSTRACT:
+                    style_abstract = para
+                elif category == _STYLE_KEYWORDS:
+                    style_keywords = para
+                elif category == _STYLE_HEADING1:
+                    style_ranges = style_sections[text] = []
+                elif style_ranges is not None:
+                    extend_ranges(style_ranges, i)
                 
-                # 识别标题
-                if not self.title:
-                    self.title = para
-                    found_structure = True
+                # 通过文本规则识别各部分，第一个段落视为标题
+                if text_title is None:
+                    text_title = para
                     continue
                 
-                # 识别摘要部分
-                if text.lower().startswith('abstract') or text.startswith('摘要'):
-                    self.abstract = para
-                    found_structure = True
-                    continue
-                
-                # 识别关键词
-                if text.lower().startswith('keywords') or text.startswith('关键词'):
-                    self.keywords = para
-                    found_structure = True
+                match = _ABSTRACT_KEYWORDS_RE.match(text)
+                if match is not None:
+                    # 识别摘要部分
+                    if match.group('abstract'):
+                        text_abstract = para
+                    # 识别关键词
+                    else:
+                        text_keywords = para
                     continue
                 
                 # 识别章节标题
-                if self._is_section_heading(text):
-                    current_section = text
-                    self.sections[current_section] = []
-                    found_structure = True
-                elif current_section and text:
-                    self.sections[current_section].append(para)
+                if is_section_heading(text):
+                    text_ranges = text_sections[text] = []
+                elif text_ranges is not None:
+                    extend_ranges(text_ranges, i)
+            
+            # 如果样式至少识别出标题和一个章节，则采用样式结果
+            if style_title is not None and style_sections:
+                self.title, self.abstract, self.keywords = style_title, style_abstract, style_keywords
+                self.sections = style_sections
+            else:
+                # 否则采用文本规则的结果：标题优先用样式识别的段落，
+                # 摘要和关键词优先用文本规则识别的段落，文本规则未识别出时才用样式的结果
+                self.title = style_title or text_title
+                self.abstract = text_abstract or style_abstract
+                self.keywords = text_keywords or style_keywords
+                self.sections = text_sections
             
-            return found_structure
+            self._reference_keys = [name for name in self.sections if _is_reference_section(name)]
+            return bool(self.title or self.sections)
         except Exception as e:
-            print(f"传统解析方法出错: {str(e)}")
+            print(f"解析文档结构出错: {str(e)}")
             return False
 
+    def _start_section(self, name: str) -> list:
+        """新建章节并返回其下标区间列表，同时记录参考文献章节"""
+        ranges = self.sections[name] = []
+        if name not in self._reference_keys and _is_reference_section(name):
+            self._reference_keys.append(name)
+        return ranges
+
+    @staticmethod
+    def _extend_ranges(ranges: list, index: int):
+        """将段落缓存下标加入章节，与上一个区间相连时直接延长该区间"""
+        if ranges and ranges[-1][1] == index:
+            ranges[-1][1] = index + 1
+        else:
+            ranges.append([index, index + 1])
+
+    def _section_paragraphs(self, ranges: list) -> list:
+        """按下标区间从段落缓存中取出章节的段落"""
+        paras = self._cached_paras
+        if len(ranges) == 1:
+            start, end = ranges[0]
+            return paras[start:end]
+        result = []
+        for start, end in ranges:
+            result.extend(paras[start:end])
+        return result
+
+    def _iter_paragraph_texts(self):
+        """
+        直接遍历正文的 w:p 元素，逐个返回 (元素, 文本)
+        不为每个段落创建Paragraph对象，文本与 Paragraph.text 相同
+        """
+        for p in self.doc.element.body.iterchildren(_W_P):
+            yield p, paragraph_text(p)
+
     def _parse_with_ai(self):
         """
         使用AI辅助解析文档结构
@@ -114,7 +278,15 @@ class Document:
         if not self.ai_assistant:
             return False
         
-        full_text = "\n".join([para.text for para in self.doc.paragraphs])
+        # 达到长度上限后不再继续收集段落文本
+        parts = []
+        total = 0
+        for _, text in self._iter_paragraph_texts():
+            parts.append(text)
+            total += len(text) + 1
+            if total >= _AI_MAX_CHARS:
+                break
+        full_text = "\n".join(parts)[:_AI_MAX_CHARS]
         ai_analysis = self.ai_assistant.analyze_document(full_text)
         
         if ai_analysis:
@@ -130,27 +302,29 @@ class Document:
             是否成功更新结构
         """
         try:
+            # 标题、摘要、关键词文本到属性名的反向映射，文本相同时标题优先
+            part_by_text = {}
+            for attr in ('keywords', 'abstract', 'title'):
+                part_text = ai_analysis.get(attr)
+                if part_text:
+                    part_by_text[part_text] = attr
+            # 预先收集章节标题，每个段落只需一次查找
+            section_titles = {section['title'] for section in ai_analysis.get('sections', [])}
+            extend_ranges = self._extend_ranges
+            current_ranges = None
+            
             # 更新文档各部分
-            for para in self.doc.paragraphs:
-                text = para.text.strip()
-                if not text:
-                    continue
-                
+            for i, (para, text, _) in enumerate(self._para_cache):
                 # 根据AI识别结果匹配段落
-                if text == ai_analysis.get('title'):
-                    self.title = para
-                elif text == ai_analysis.get('abstract'):
-                    self.abstract = para
-                elif text == ai_analysis.get('keywords'):
-                    self.keywords = para
+                attr = part_by_text.get(text)
+                if attr is not None:
+                    setattr(self, attr, para)
                 
                 # 处理章节
-                for section in ai_analysis.get('sections', []):
-                    if text == section['title']:
-                        current_section = text
-                        self.sections[current_section] = []
-                    elif current_section:
-                        self.sections[current_section].append(para)
+                if text in section_titles:
+                    current_ranges = self._start_section(text)
+                elif current_ranges is not None:
+                    extend_ranges(current_ranges, i)
             
             return bool(self.title or self.abstract or self.sections)
         except Exception as e:
@@ -161,18 +335,7 @@ class Document:
         """
         判断是否为章节标题
         """
-        # 检查数字编号格式
-        if any(text.startswith(f"{i}.") for i in range(1, 10)):
-            return True
-        
-        # 检查中文数字编号格式
-        chinese_numbers = ['一', '二', '三', '四', '五', '六', '七', '八', '九']
-        if any(text.startswith(f"{num}、") for num in chinese_numbers):
-            return True
-        
-        # 检查特定的标题关键词
-        heading_keywords = ['引言', '介绍', '研究方法', '实验', '结果', '讨论', '结论', '参考文献']
-        return any(keyword in text for keyword in heading_keywords)
+        return _SECTION_HEADING_RE.search(text) is not None
 
     def get_title(self):
         """获取论文标题"""
@@ -188,18 +351,18 @@ class Document:
 
     def get_section(self, section_name):
         """获取指定章节的内容"""
-        return self.sections.get(section_name, [])
+        ranges = self.sections.get(section_name)
+        return self._section_paragraphs(ranges) if ranges else []
 
     def get_all_sections(self):
         """获取所有章节"""
-        return self.sections
+        return {name: self._section_paragraphs(ranges) for name, ranges in self.sections.items()}
 
     def get_references(self):
         """获取参考文献部分"""
         references = []
-        for section_name, paragraphs in self.sections.items():
-            if '参考文献' in section_name or 'references' in section_name.lower():
-                references.extend(paragraphs)
+        for section_name in self._reference_keys:
+            references.extend(self.get_section(section_name))
         return references
 
     def get_tables(self):
@@ -218,6 +381,15 @@ class Document:
         except Exception as e:
             print(f"保存文档失败: {str(e)}")
 
+    def open_original(self):
+        """从内存中的原始数据重新打开一份未经修改的文档"""
+        return DocxDocument(io.BytesIO(self._buf.getvalue()))
+
+    def save_original(self, output_path: str):
+        """将未经修改的原始文档写入指定路径"""
+        with open(output_path, 'wb') as f:
+            f.write(self._buf.getvalue())
+
     def get_paragraphs(self):
         """获取所有段落"""
         return self.doc.paragraphs
@@ -234,57 +406,58 @@ class Document:
             content = self.keywords.text if self.keywords else None
         # 还可以添加其他部分的相关功能
         
-        if content:
-            return self.ai_assistant.suggest_formatting(section_type, content)
-        return None
+        if not content or not self.ai_assistant:
+            return None
+        
+        # 以模型名称而非AI助手对象为键，缓存不会让助手实例一直存活
+        cache = self._suggestion_cache
+        cache_key = (self.ai_assistant.model, section_type, content)
+        suggestion = cache.get(cache_key)
+        if suggestion is not None:
+            cache.move_to_end(cache_key)
+            return suggestion
+        
+        suggestion = self.ai_assistant.suggest_formatting(section_type, content)
+        # 只缓存成功的结果，失败后下次仍可重试
+        if suggestion is not None:
+            cache[cache_key] = suggestion
+            if len(cache) > _SUGGESTION_CACHE_SIZE:
+                cache.popitem(last=False)
+        return suggestion
 
     def add_section_breaks(self):
         """
         为每个主要章节添加分节符
         """
         try:
-            # 获取所有段落
-            paragraphs = self.doc.paragraphs
+            cache = self._para_cache
             
-            # 遍历段落，为每个一级标题前添加分节符
-            for i, para in enumerate(paragraphs):
-                if self._is_main_section_heading(para.text):
-                    # 在当前段落前添加分节符
-                    run = para._p.get_or_add_pPr()
-                    sectPr = run.get_or_add_sectPr()
-                    # 设置分节类型为下一页
-                    sectPr.set('type', 'nextPage')
-                    print(f"已在章节 '{para.text}' 前添加分节符")
+            # 为每个一级标题前添加分节符
+            for i in self._get_main_section_indices():
+                para, text, _ = cache[i]
+                # 在当前段落前添加分节符
+                run = para._p.get_or_add_pPr()
+                sectPr = run.get_or_add_sectPr()
+                # 设置分节类型为下一页
+                sectPr.set('type', 'nextPage')
+                print(f"已在章节 '{text}' 前添加分节符")
         
         except Exception as e:
             print(f"添加分节符时出错: {str(e)}")
 
+    def _get_main_section_indices(self) -> list:
+        """获取一级章节标题在段落缓存中的下标，只计算一次"""
+        if self._main_section_idx is None:
+            match = _MAIN_SECTION_HEADING_RE.match
+            self._main_section_idx = [i for i, (_, text, _) in enumerate(self._para_cache)
+                                      if match(text) is not None]
+        return self._main_section_idx
+
     def _is_main_section_heading(self, text: str) -> bool:
         """
         判断是否为一级章节标题
         """
-        text = text.strip()
-        
-        # 检查数字编号格式（如 "1. 引言"）
-        if any(text.startswith(f"{i}. ") for i in range(1, 10)):
-            return True
-        
-        # 检查中文数字编号格式（如 "一、引言"）
-        chinese_numbers = ['一', '二', '三', '四', '五', '六', '七', '八', '九']
-        if any(text.startswith(f"{num}、") for num in chinese_numbers):
-            return True
-        
-        # 检查特定的一级标题关键词
-        main_section_keywords = [
-            '引言', '介绍',
-            '研究背景', '理论基础',
-            '研究方法', '实验方法',
-            '结果分析', '实验结果',
-            '讨论', '结论',
-            '参考文献'
-        ]
-        
-        return any(text.startswith(keyword) for keyword in main_section_keywords)
+        return _MAIN_SECTION_HEADING_RE.match(text.strip()) is not None
 
     def format_sections(self):
         """
@@ -295,11 +468,17 @@ class Document:
         
         # 然后应用格式
         sections = self.get_all_sections()
+        
+        # 一次遍历段落缓存，记录每个章节名对应的第一个标题段落
+        heading_index = {}
+        for para, text, _ in self._para_cache:
+            if text in sections and text not in heading_index:
+                heading_index[text] = para
+        
         for section_name, paragraphs in sections.items():
             # 格式化章节标题
             if section_name in self.sections:
-                section_para = next((p for p in self.doc.paragraphs 
-                                 if p.text.strip() == section_name), None)
+                section_para = heading_index.get(section_name)
                 if section_para:
                     if self._is_main_section_heading(section_name):
                         self._apply_section_format(section_para, self.format_spec.heading1)
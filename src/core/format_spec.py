@@ -1,10 +1,44 @@
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Dict, Optional, List
-import json
+import copy
+import hashlib
+import os
+import sys
+import threading
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, List, Tuple
 import yaml
 from pathlib import Path
+from ..utils import json_io
 
-@dataclass
+# 优先使用基于libyaml的C解析器，未编译libyaml时退回纯Python实现
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Python 3.10 及以上为数据类生成 __slots__，实例不再携带 __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# 只读的空映射，缺省的格式项共用它，不必每次新建空字典；只读代理保证它不会被意外写入
+_EMPTY: Mapping = MappingProxyType({})
+
+# 段落对齐方式枚举值 0~3 对应的名称
+_ALIGN_NAMES = ("LEFT", "CENTER", "RIGHT", "JUSTIFY")
+
+# 预设YAML转换后的JSON缓存目录，YAML未修改时直接读取JSON
+_PRESET_JSON_DIR = Path.home() / '.w0rdF0rmat' / 'preset_cache'
+
+# 已解析的预设格式缓存，键为 (预设文件路径, 修改时间)，所有解析器实例共享
+# 缓存中的对象不直接交给调用方，每个解析器持有自己的副本
+_PRESET_CACHE: Dict[Tuple[str, int], "DocumentFormat"] = {}
+# 文档加载线程和界面线程可能同时创建解析器，加载预设时加锁避免重复解析
+_PRESET_LOCK = threading.Lock()
+
+# AI解析格式要求结果缓存的最大条目数
+_REQUIREMENTS_CACHE_SIZE = 64
+
+@dataclass(**_SLOTS)
 class SectionFormat:
     font_size: float
     font_name: str = "Times New Roman"
@@ -16,7 +50,7 @@ class SectionFormat:
     space_before: float = 0
     space_after: float = 0
 
-@dataclass
+@dataclass(**_SLOTS)
 class TableCellFormat:
     """表格单元格格式定义"""
     font_size: float = 10.5
@@ -29,7 +63,7 @@ class TableCellFormat:
     background_color: Optional[str] = None
     line_spacing: float = 1.0
 
-@dataclass
+@dataclass(**_SLOTS)
 class TableFormat:
     """表格格式定义"""
     style: str = "DEFAULT"
@@ -56,7 +90,7 @@ class TableFormat:
     spacing_before: float = 6
     spacing_after: float = 6
 
-@dataclass
+@dataclass(**_SLOTS)
 class ImageFormat:
     """图片格式定义"""
     width: float = None  # 宽度（磅值），None表示保持原始大小
@@ -68,7 +102,7 @@ class ImageFormat:
     space_before: float = 12  # 图片前间距
     space_after: float = 12  # 图片后间距
 
-@dataclass
+@dataclass(**_SLOTS)
 class CaptionFormat:
     """图表标题格式定义"""
     prefix: str = ""  # 前缀（如"图"或"表"）
@@ -82,7 +116,7 @@ class CaptionFormat:
     separator: str = " "  # 编号与标题文本之间的分隔符
     end_mark: str = ""  # 标题末尾的标记（如句号）
 
-@dataclass
+@dataclass(**_SLOTS)
 class PageSetupFormat:
     """页面设置格式定义"""
     # 页面大小
@@ -113,7 +147,7 @@ class PageSetupFormat:
     # 纸张方向
     orientation: str = "PORTRAIT"  # PORTRAIT 或 LANDSCAPE
 
-@dataclass
+@dataclass(**_SLOTS)
 class TOCFormat:
     """目录格式定义"""
     title: str = "目录"  # 目录标题
@@ -145,7 +179,7 @@ class TOCFormat:
     include_heading_levels: int = 2  # 包含的标题级别数
     start_on_new_page: bool = True
 
-@dataclass
+@dataclass(**_SLOTS)
 class DocumentFormat:
     title: SectionFormat
     abstract: SectionFormat
@@ -176,30 +210,121 @@ class DocumentFormat:
         if self.toc is None:
             self.toc = TOCFormat()
 
+def _pt_or(length, default):
+    """将长度转换为磅值，未设置时返回默认值"""
+    return length.pt if length else default
+
+# 后备格式中各部分的段落格式参数
+_FALLBACK_SECTION_DICTS = {
+    'title': {'font_size': 16, 'bold': True, 'alignment': "CENTER"},
+    'abstract': {'font_size': 12, 'first_line_indent': 24},
+    'keywords': {'font_size': 12},
+    'heading1': {'font_size': 14, 'bold': True},
+    'heading2': {'font_size': 13, 'bold': True},
+    'body': {'font_size': 12, 'first_line_indent': 24, 'line_spacing': 1.5},
+    'references': {'font_size': 10.5, 'first_line_indent': -24},
+}
+
+# 后备格式的页边距（英寸）
+_FALLBACK_PAGE_MARGIN = {"top": 1.0, "bottom": 1.0, "left": 1.25, "right": 1.25}
+
+# 从文档样式名识别各部分时，按顺序查找样式名（小写）中包含的部分名称
+_SECTION_STYLE_KEYS = ('title', 'abstract', 'keywords', 'heading1', 'heading2', 'body', 'references')
+
+def _new_fallback_format() -> DocumentFormat:
+    """按默认参数新建后备格式，交给调用方的后备格式都由它创建，调用方可以自由修改"""
+    return DocumentFormat(
+        **{name: SectionFormat(**kwargs) for name, kwargs in _FALLBACK_SECTION_DICTS.items()},
+        page_margin=dict(_FALLBACK_PAGE_MARGIN),
+        tables=TableFormat(),
+        images=ImageFormat(),
+        figure_caption=CaptionFormat(prefix="图"),
+        table_caption=CaptionFormat(prefix="表"),
+        page_setup=PageSetupFormat(),
+        toc=TOCFormat()
+    )
+
 class FormatSpecParser:
+    # AI解析格式要求的结果缓存，键为模型和要求文本的摘要，相同要求不再重复请求
+    # 按最近使用顺序排列，超过 _REQUIREMENTS_CACHE_SIZE 条时丢弃最久未用的结果
+    _requirements_cache: "OrderedDict[str, DocumentFormat]" = OrderedDict()
+
     def __init__(self):
-        self.preset_formats = {}
-        self._load_preset_formats()
+        # 预设格式在首次访问时才加载
+        self._preset_formats = None
+    
+    @property
+    def preset_formats(self) -> Dict[str, DocumentFormat]:
+        """预设格式，首次访问时加载一次"""
+        if self._preset_formats is None:
+            self._preset_formats = {}
+            self._load_preset_formats()
+        return self._preset_formats
     
     def _load_preset_formats(self) -> None:
         """
         加载预设的格式模板
         """
+        presets = self._preset_formats
         preset_path = Path(__file__).parent / "presets"
         
         if preset_path.exists():
-            for format_file in preset_path.glob("*.yaml"):
-                try:
-                    with open(format_file, 'r', encoding='utf-8') as f:
-                        format_data = yaml.safe_load(f)
-                        self.preset_formats[format_file.stem] = self._parse_format_data(format_data)
-                except Exception as e:
-                    print(f"加载预设格式 {format_file.name} 失败: {str(e)}")
-                    continue
+            with _PRESET_LOCK:
+                for format_file in preset_path.iterdir():
+                    # 直接比较后缀，不必为每个目录项做通配符匹配
+                    if format_file.suffix != '.yaml' or not format_file.is_file():
+                        continue
+                    try:
+                        # 文件未修改时直接复用已解析的结果，不再重复解析YAML
+                        stat = format_file.stat()
+                        path, mtime_ns = str(format_file), stat.st_mtime_ns
+                        preset = _PRESET_CACHE.get((path, mtime_ns))
+                        if preset is None:
+                            format_data = self._read_preset_data(format_file, mtime_ns, stat.st_size)
+                            preset = self._parse_format_data(format_data)
+                            # 丢弃该文件修改前的缓存
+                            for key in [k for k in _PRESET_CACHE if k[0] == path]:
+                                del _PRESET_CACHE[key]
+                            _PRESET_CACHE[(path, mtime_ns)] = preset
+                        # 调用方可能修改返回的格式，各解析器使用副本，不影响共享的缓存
+                        presets[format_file.stem] = copy.deepcopy(preset)
+                    except Exception as e:
+                        print(f"加载预设格式 {format_file.name} 失败: {str(e)}")
+                        continue
         
         # 如果没有成功加载任何预设格式，使用后备格式
-        if not self.preset_formats:
-            self.preset_formats['default'] = self._get_fallback_format()
+        if not presets:
+            presets['default'] = self._get_fallback_format()
+    
+    def _read_preset_data(self, format_file: Path, mtime_ns: int, size: int) -> dict:
+        """
+        读取预设文件内容，优先使用JSON缓存
+        缓存中记录了生成它的YAML文件的修改时间和大小，两者都与当前文件一致时才使用；
+        YAML被替换为修改时间更早的文件（如检出旧版本、恢复备份）时也会重新解析
+        """
+        # 缓存目录由所有安装共享，文件名带上YAML绝对路径的摘要，不同目录下的同名预设互不干扰
+        path_digest = hashlib.blake2b(str(format_file.resolve()).encode('utf-8'),
+                                      digest_size=8).hexdigest()
+        json_file = _PRESET_JSON_DIR / f"{format_file.stem}-{path_digest}.json"
+        try:
+            cached = json_io.loads(json_file.read_bytes())
+            if cached.get('mtime_ns') == mtime_ns and cached.get('size') == size:
+                return cached['data']
+        except (OSError, ValueError, AttributeError, KeyError):
+            pass
+        
+        with open(format_file, 'r', encoding='utf-8') as f:
+            format_data = yaml.load(f, Loader=_YamlLoader)
+        
+        try:
+            _PRESET_JSON_DIR.mkdir(parents=True, exist_ok=True)
+            # 先写入临时文件再替换，其他进程不会读到写了一半的缓存
+            tmp_file = json_file.with_name(f"{json_file.name}.{os.getpid()}.tmp")
+            tmp_file.write_bytes(json_io.dumps({'mtime_ns': mtime_ns, 'size': size, 'data': format_data}))
+            os.replace(tmp_file, json_file)
+        except Exception as e:
+            print(f"写入预设格式缓存 {json_file.name} 失败: {str(e)}")
+        return format_data
     
     def parse_format_file(self, file_path: str) -> Optional[DocumentFormat]:
         """
@@ -207,23 +332,26 @@ class FormatSpecParser:
         """
         try:
             path = Path(file_path)
-            with open(path, 'r', encoding='utf-8') as f:
-                if path.suffix.lower() == '.yaml':
-                    format_data = yaml.safe_load(f)
-                else:
-                    format_data = json.load(f)
-                return self._parse_format_data(format_data)
+            if path.suffix.lower() == '.yaml':
+                with open(path, 'r', encoding='utf-8') as f:
+                    format_data = yaml.load(f, Loader=_YamlLoader)
+            else:
+                format_data = json_io.loads(path.read_bytes())
+            return self._parse_format_data(format_data)
         except Exception as e:
             print(f"解析格式文件失败: {str(e)}")
             return None
     
     def _parse_format_data(self, data: dict) -> DocumentFormat:
         """解析格式数据为DocumentFormat对象"""
+        # 已经是解析好的格式对象时直接返回
+        if isinstance(data, DocumentFormat):
+            return data
         try:
             # 解析表格格式
-            table_data = data.get('tables', {})
-            header_format = TableCellFormat(**table_data.get('header_format', {}))
-            data_format = TableCellFormat(**table_data.get('data_format', {}))
+            table_data = data.get('tables', _EMPTY)
+            header_format = TableCellFormat(**table_data.get('header_format', _EMPTY))
+            data_format = TableCellFormat(**table_data.get('data_format', _EMPTY))
             table_format = TableFormat(
                 header_format=header_format,
                 data_format=data_format,
@@ -231,13 +359,13 @@ class FormatSpecParser:
             )
             
             return DocumentFormat(
-                title=SectionFormat(**data.get('title', {})),
-                abstract=SectionFormat(**data.get('abstract', {})),
-                keywords=SectionFormat(**data.get('keywords', {})),
-                heading1=SectionFormat(**data.get('heading1', {})),
-                heading2=SectionFormat(**data.get('heading2', {})),
-                body=SectionFormat(**data.get('body', {})),
-                references=SectionFormat(**data.get('references', {})),
+                title=SectionFormat(**data.get('title', _EMPTY)),
+                abstract=SectionFormat(**data.get('abstract', _EMPTY)),
+                keywords=SectionFormat(**data.get('keywords', _EMPTY)),
+                heading1=SectionFormat(**data.get('heading1', _EMPTY)),
+                heading2=SectionFormat(**data.get('heading2', _EMPTY)),
+                body=SectionFormat(**data.get('body', _EMPTY)),
+                references=SectionFormat(**data.get('references', _EMPTY)),
                 page_margin=data.get('page_margin', {
                     "top": 1.0,
                     "bottom": 1.0,
@@ -260,8 +388,16 @@ class FormatSpecParser:
             解析后的DocumentFormat对象
         """
         if config_manager and config_manager.is_ai_enabled():
-            from .ai_assistant import DocumentAI
-            ai = DocumentAI(config_manager)
+            # 每次读取当前的模型设置，命中缓存时不创建DocumentAI
+            model = config_manager.get_ai_model()
+            cache_key = hashlib.blake2b(f"{model}\n{requirements}".encode('utf-8'),
+                                        digest_size=16).hexdigest()
+            cache = self._requirements_cache
+            cached = cache.get(cache_key)
+            if cached is not None:
+                cache.move_to_end(cache_key)
+                # 缓存的结果由所有调用方共享，返回副本
+                return copy.deepcopy(cached)
             
             prompt = f"""
             请将以下论文格式要求转换为标准的JSON格式，包含以下字段：
@@ -290,9 +426,16 @@ class FormatSpecParser:
             """
             
             try:
+                # 仅在需要调用AI时才导入；OpenAI客户端按API密钥在进程内共享，创建实例开销很小
+                from .ai_assistant import DocumentAI
+                ai = DocumentAI(config_manager)
                 result = ai.suggest_formatting("document", requirements)
                 if result:
-                    return self._parse_format_data(result)
+                    document_format = self._parse_format_data(result)
+                    cache[cache_key] = copy.deepcopy(document_format)
+                    if len(cache) > _REQUIREMENTS_CACHE_SIZE:
+                        cache.popitem(last=False)
+                    return document_format
             except Exception as e:
                 print(f"AI解析格式要求失败: {str(e)}")
         
@@ -309,49 +452,43 @@ class FormatSpecParser:
         """
         获取默认格式
         """
-        return self.preset_formats.get('default', self._get_fallback_format())
+        return self.preset_formats.get('default') or self._get_fallback_format()
     
     def _get_fallback_format(self) -> DocumentFormat:
         """
         获取后备的默认格式
+        每次新建一个，调用方修改它不会影响其他解析器
         """
-        return DocumentFormat(
-            title=SectionFormat(font_size=16, bold=True, alignment="CENTER"),
-            abstract=SectionFormat(font_size=12, first_line_indent=24),
-            keywords=SectionFormat(font_size=12),
-            heading1=SectionFormat(font_size=14, bold=True),
-            heading2=SectionFormat(font_size=13, bold=True),
-            body=SectionFormat(font_size=12, first_line_indent=24, line_spacing=1.5),
-            references=SectionFormat(font_size=10.5, first_line_indent=-24),
-            page_margin={"top": 1.0, "bottom": 1.0, "left": 1.25, "right": 1.25},
-            tables=TableFormat(),
-            images=ImageFormat(),
-            figure_caption=CaptionFormat(prefix="图"),
-            table_caption=CaptionFormat(prefix="表"),
-            page_setup=PageSetupFormat(),
-            toc=TOCFormat()
-        ) 
+        return _new_fallback_format()
     
     def parse_document_styles(self, document) -> Optional[DocumentFormat]:
         """
         尝试从文档现有样式创建格式规范
         """
         try:
+            # 按样式ID去重，每种样式只保留最后一个使用它的段落
+            exemplars = {}
+            for para, _, _ in document.get_paragraph_cache():
+                exemplars[para._p.style] = para
+            
             # 获取文档中使用的样式
             styles = {}
-            for para in document.doc.paragraphs:
-                if para.style and para.text.strip():
-                    style = para.style
+            for para in exemplars.values():
+                style = para.style
+                if style:
+                    # 每个属性只读取一次，python-docx每次访问都要查找XML
+                    font = style.font
+                    pf = para.paragraph_format
                     styles[style.name] = {
-                        'font_size': style.font.size.pt if style.font.size else 12,
-                        'font_name': style.font.name if style.font.name else "Times New Roman",
-                        'bold': style.font.bold if style.font.bold else False,
-                        'italic': style.font.italic if style.font.italic else False,
+                        'font_size': _pt_or(font.size, 12),
+                        'font_name': font.name or "Times New Roman",
+                        'bold': font.bold or False,
+                        'italic': font.italic or False,
                         'alignment': self._get_alignment_name(para.alignment),
-                        'first_line_indent': para.paragraph_format.first_line_indent.pt if para.paragraph_format.first_line_indent else 0,
-                        'line_spacing': para.paragraph_format.line_spacing if para.paragraph_format.line_spacing else 1.0,
-                        'space_before': para.paragraph_format.space_before.pt if para.paragraph_format.space_before else 0,
-                        'space_after': para.paragraph_format.space_after.pt if para.paragraph_format.space_after else 0
+                        'first_line_indent': _pt_or(pf.first_line_indent, 0),
+                        'line_spacing': pf.line_spacing or 1.0,
+                        'space_before': _pt_or(pf.space_before, 0),
+                        'space_after': _pt_or(pf.space_after, 0)
                     }
             
             if styles:
@@ -366,27 +503,28 @@ class FormatSpecParser:
         """
         从样式字典创建格式规范
         """
-        # 映射样式到文档部分
-        title_style = next((s for name, s in styles.items() if 'title' in name.lower()), None)
-        abstract_style = next((s for name, s in styles.items() if 'abstract' in name.lower()), None)
-        # ... 其他部分类似
+        # 一次遍历样式，每个样式只归入第一个名称匹配的部分，每部分取第一个匹配的样式
+        buckets = {}
+        for name, style in styles.items():
+            lowered = name.lower()
+            for key in _SECTION_STYLE_KEYS:
+                if key in lowered:
+                    buckets.setdefault(key, style)
+                    break
         
-        return DocumentFormat(
-            title=SectionFormat(**(title_style or self._get_fallback_format().title.__dict__)),
-            abstract=SectionFormat(**(abstract_style or self._get_fallback_format().abstract.__dict__)),
-            # ... 其他部分类似
-        )
+        # 没有对应样式的部分按后备格式的参数构造
+        sections = {
+            section: SectionFormat(**buckets.get(section, defaults))
+            for section, defaults in _FALLBACK_SECTION_DICTS.items()
+        }
+        return DocumentFormat(**sections, page_margin=dict(_FALLBACK_PAGE_MARGIN))
     
     def _get_alignment_name(self, alignment) -> str:
         """
         将对齐方式转换为字符串
         """
-        alignment_map = {
-            0: "LEFT",
-            1: "CENTER",
-            2: "RIGHT",
-            3: "JUSTIFY"
-        }
-        return alignment_map.get(alignment, "LEFT")
+        if alignment is not None and 0 <= alignment < 4:
+            return _ALIGN_NAMES[alignment]
+        return "LEFT"
     
     # ... 其他方法保持不变 ... 
\ No newline at end of file
@@ -1,42 +1,194 @@
-from typing import Dict, List, Optional
+import re
+from collections import namedtuple
+from typing import Callable, Dict, List, Optional
 from docx.shared import Pt
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+from docx.enum.table import WD_TABLE_ALIGNMENT
+from docx.text.paragraph import Paragraph
+from docx.oxml.ns import qn, nsmap
+from lxml import etree
 from .format_spec import DocumentFormat
+from .document import paragraph_text
+
+# 对齐方式枚举值与格式要求中名称的双向映射
+_ALIGNMENT_NAMES = {
+    WD_PARAGRAPH_ALIGNMENT.CENTER: "CENTER",
+    WD_PARAGRAPH_ALIGNMENT.LEFT: "LEFT",
+    WD_PARAGRAPH_ALIGNMENT.RIGHT: "RIGHT",
+    WD_PARAGRAPH_ALIGNMENT.JUSTIFY: "JUSTIFY"
+}
+_ALIGNMENT_VALUES = {name: value for value, name in _ALIGNMENT_NAMES.items()}
+# 格式要求中的对齐方式无法识别时使用，与任何段落的对齐方式都不相等
+_UNKNOWN_ALIGNMENT = object()
+# 图片段落和表格要求的居中对齐
+_ALIGN_CENTER = WD_PARAGRAPH_ALIGNMENT.CENTER
+_TBL_CENTER = WD_TABLE_ALIGNMENT.CENTER
+
+# 上、下、左、右页边距的名称，顺序与页边距元组一致，以及页边距错误的消息模板
+_MARGIN_LABELS = ("上边距", "下边距", "左边距", "右边距")
+_MARGIN_MSG = "页边距不符合要求：{}不正确"
+# 每磅对应的EMU数，页边距按EMU整数比较
+_EMUS_PER_PT = 12700
+# 以页边距不一致位掩码（第i位对应第i条边）为下标的错误边距名称，预先拼接好
+_MASK_TO_LABELS = tuple(
+    ', '.join(label for i, label in enumerate(_MARGIN_LABELS) if mask >> i & 1)
+    for mask in range(16)
+)
+
+# WordprocessingML 段落及图片节点的限定名
+_W_P = qn('w:p')
+_W_DRAWING = qn('w:drawing')
+
+# 单元格第一个段落第一个run的加粗设置，预先编译XPath
+_FIRST_RUN_BOLD_XPATH = etree.XPath('./w:p[1]/w:r[1]/w:rPr/w:b', namespaces={'w': nsmap['w']})
+_W_VAL = qn('w:val')
+# w:b 的 w:val 为以下值时表示不加粗，省略 w:val 表示加粗
+_OFF_VALUES = frozenset({'0', 'false', 'off'})
+
+# 一级标题的编号前缀（如 "1. " 或 "一、"）及完整匹配的一级标题名称
+_MAIN_HEADING_RE = re.compile(r'[1-9]\. |[一二三四五六七八九]、')
+_MAIN_HEADING_SET = frozenset({'引言', '介绍', '研究方法', '实验', '结果', '讨论', '结论', '参考文献'})
+# 关键词段落开头的标签，以及关键词之间的分隔符
+_KEYWORDS_LABEL_RE = re.compile(r'^(?:key\s?words?|关键词|关键字)\s*[:：]?\s*', re.IGNORECASE)
+_KEYWORD_SEP_RE = re.compile(r'[,，;；、]')
+# 字母和数字以外的字符（与 str.isalnum 一致，下划线也不算）
+_NON_ALNUM_RE = re.compile(r'[\W_]')
+
+class ValidationResult(namedtuple("ValidationResult", "section element is_valid template args")):
+    """单条验证结果，消息文本在读取 message 时才由模板和参数格式化"""
+    __slots__ = ()
+    
+    @property
+    def message(self) -> str:
+        """格式化后的验证消息"""
+        return self.template.format(*self.args) if self.args else self.template
+
+def _first_run_font_size(paragraph):
+    """获取段落第一个run的字号（磅），没有run或未设置字号时返回None"""
+    # runs 每次访问都会重新遍历段落的子元素，这里只取一次
+    runs = paragraph.runs
+    if not runs:
+        return None
+    size = runs[0].font.size
+    return size.pt if size is not None else None
+
+def _is_first_run_bold(tc) -> bool:
+    """判断单元格第一个段落的第一个run是否直接设置了加粗"""
+    bold = _FIRST_RUN_BOLD_XPATH(tc)
+    return bool(bold) and bold[0].get(_W_VAL) not in _OFF_VALUES
+
+def _margin_mismatch_mask(section, expected) -> int:
+    """
+    比较节的页边距与要求的页边距（上、下、左、右，EMU）
+    返回4位掩码，第0~3位依次表示上、下、左、右页边距不一致，全部正确时为0
+    """
+    # 页边距本身就是以EMU为单位的整数，直接比较，不换算为磅值
+    actual = (section.top_margin, section.bottom_margin,
+              section.left_margin, section.right_margin)
+    if actual == expected:
+        return 0
+    return ((actual[0] != expected[0])
+            | (actual[1] != expected[1]) << 1
+            | (actual[2] != expected[2]) << 2
+            | (actual[3] != expected[3]) << 3)
 
 class FormatValidator:
+    __slots__ = ('document', 'format_spec', 'validation_results', '_append', '_cache', '_body_checker',
+                 '_expected_margins', '_section', '_validated')
+    
     def __init__(self, document, format_spec: DocumentFormat):
         self.document = document
         self.format_spec = format_spec
         self.validation_results = []
-    
-    def validate_all(self) -> List[Dict]:
+        self._append = self.validation_results.append
+        # validate_all 执行期间缓存的文档各部分，键为 get_ 之后的访问器名
+        self._cache = None
+        # 固定了正文格式要求的段落检查函数，首次使用时生成
+        self._body_checker = None
+        # 格式要求在验证器生命周期内不变，要求的上、下、左、右页边距只读取一次并换算为EMU
+        # 没有页面设置要求时为None，不验证页面设置
+        ps = getattr(format_spec, 'page_setup', None)
+        self._expected_margins = None if ps is None else tuple(
+            int(round(margin * _EMUS_PER_PT))
+            for margin in (ps.margin_top, ps.margin_bottom, ps.margin_left, ps.margin_right)
+        )
+        # 文档的第一个节，首次验证页面设置时获取
+        self._section = None
+        # 已经验证过的部分，避免重复调用时重复记录同样的结果
+        self._validated = set()
+    
+    @classmethod
+    def compile(cls, format_spec: DocumentFormat) -> Callable[..., List[ValidationResult]]:
+        """
+        按格式要求生成文档验证函数
+        格式要求只处理一次（页边距换算、正文检查函数等），之后每个文档只需调用返回的函数
+        返回的函数复用同一个验证器，不能在多个线程中同时调用
+        用法：
+            validate = FormatValidator.compile(format_spec)
+            for document in documents:
+                results = validate(document)
+        """
+        validator = cls(None, format_spec)
+        validator._get_body_checker()
+        
+        def validate(document) -> List[ValidationResult]:
+            validator.reset(document)
+            return validator.validate_all()
+        
+        return validate
+    
+    def validate_all(self) -> List[ValidationResult]:
         """验证所有格式"""
-        self.validation_results = []
+        self.reset()
         
-        # 验证各个部分
-        self.validate_title()
-        self.validate_abstract()
-        self.validate_keywords()
-        self.validate_sections()
-        self.validate_tables()
-        self.validate_images()
-        self.validate_page_setup()
+        # 各部分只从文档中获取一次，供所有验证方法共用
+        self._cache = {
+            name: getattr(self.document, f"get_{name}")()
+            for name in ('title', 'abstract', 'keywords', 'all_sections', 'tables')
+        }
+        try:
+            # 验证各个部分
+            self.validate_title()
+            self.validate_abstract()
+            self.validate_keywords()
+            self.validate_sections()
+            self.validate_tables()
+            self.validate_images()
+            self.validate_page_setup()
+        finally:
+            self._cache = None
         
         return self.validation_results
     
+    def reset(self, document=None):
+        """
+        清空验证结果和已验证标记
+        传入 document 时改为验证该文档，验证器可以复用于多个文档
+        """
+        if document is not None:
+            self.document = document
+            self._section = None
+        self.validation_results = []
+        self._append = self.validation_results.append
+        self._validated.clear()
+    
+    def _get_part(self, name: str):
+        """获取文档的某一部分，validate_all 执行期间直接读取缓存"""
+        if self._cache is not None:
+            return self._cache[name]
+        return getattr(self.document, f"get_{name}")()
+    
     def _add_validation_result(self, section: str, element: str, 
-                             is_valid: bool, message: str):
-        """添加验证结果"""
-        self.validation_results.append({
-            "section": section,
-            "element": element,
-            "is_valid": is_valid,
-            "message": message
-        })
+                             is_valid: bool, message: str, *args):
+        """
+        添加验证结果
+        message 可以是带 {} 占位符的模板，args 为对应参数，读取结果消息时才格式化
+        """
+        self._append(ValidationResult(section, element, is_valid, message, args))
     
     def validate_title(self):
         """验证标题格式"""
-        title = self.document.get_title()
+        title = self._get_part('title')
         if not title:
             self._add_validation_result(
                 "title", "existence",
@@ -45,32 +197,29 @@ class FormatValidator:
             return
         
         # 验证字体大小
-        font_size = title.runs[0].font.size.pt if title.runs else None
+        font_size = _first_run_font_size(title)
         if font_size != self.format_spec.title.font_size:
             self._add_validation_result(
                 "title", "font_size",
                 False,
-                f"标题字号不符合要求：当前 {font_size}pt，应为 {self.format_spec.title.font_size}pt"
+                "标题字号不符合要求：当前 {}pt，应为 {}pt",
+                font_size, self.format_spec.title.font_size
             )
         
-        # 验证对齐方式
-        alignment_map = {
-            WD_PARAGRAPH_ALIGNMENT.CENTER: "CENTER",
-            WD_PARAGRAPH_ALIGNMENT.LEFT: "LEFT",
-            WD_PARAGRAPH_ALIGNMENT.RIGHT: "RIGHT",
-            WD_PARAGRAPH_ALIGNMENT.JUSTIFY: "JUSTIFY"
-        }
-        current_alignment = alignment_map.get(title.alignment)
-        if current_alignment != self.format_spec.title.alignment:
+        # 验证对齐方式：要求的对齐方式转换为枚举值后直接比较，只在不符合时才转换为名称
+        expected_alignment = self.format_spec.title.alignment
+        if title.alignment != _ALIGNMENT_VALUES.get(expected_alignment, _UNKNOWN_ALIGNMENT):
+            current_alignment = _ALIGNMENT_NAMES.get(title.alignment)
             self._add_validation_result(
                 "title", "alignment",
                 False,
-                f"标题对齐方式不符合要求：当前为 {current_alignment}，应为 {self.format_spec.title.alignment}"
+                "标题对齐方式不符合要求：当前为 {}，应为 {}",
+                current_alignment, expected_alignment
             )
     
     def validate_abstract(self):
         """验证摘要格式"""
-        abstract = self.document.get_abstract()
+        abstract = self._get_part('abstract')
         if not abstract:
             self._add_validation_result(
                 "abstract", "existence",
@@ -86,23 +235,25 @@ class FormatValidator:
                 self._add_validation_result(
                     "abstract", "indent",
                     False,
-                    f"摘要首行缩进不符合要求：当前 {current_indent}pt，应为 {self.format_spec.abstract.first_line_indent}pt"
+                    "摘要首行缩进不符合要求：当前 {}pt，应为 {}pt",
+                    current_indent, self.format_spec.abstract.first_line_indent
                 )
     
     def validate_sections(self):
         """验证章节格式"""
-        sections = self.document.get_all_sections()
+        sections = self._get_part('all_sections')
+        headings = self._scan_paragraphs()[0]
+        check_body_paragraph = self._get_body_checker()
         for section_name, paragraphs in sections.items():
             # 验证章节标题
             if section_name in self.document.sections:
-                section_para = next((p for p in self.document.doc.paragraphs 
-                                 if p.text.strip() == section_name), None)
+                section_para = headings.get(section_name)
                 if section_para:
                     self._validate_heading(section_para, section_name)
             
             # 验证正文段落
             for para in paragraphs:
-                self._validate_body_paragraph(para)
+                check_body_paragraph(para)
     
     def _validate_heading(self, paragraph, heading_text):
         """验证标题格式"""
@@ -115,55 +266,77 @@ class FormatValidator:
             heading_type = "二级标题"
         
         # 验证字体大小
-        font_size = paragraph.runs[0].font.size.pt if paragraph.runs else None
+        font_size = _first_run_font_size(paragraph)
         if font_size != spec.font_size:
             self._add_validation_result(
                 "heading", heading_text,
                 False,
-                f"{heading_type}字号不符合要求：当前 {font_size}pt，应为 {spec.font_size}pt"
+                "{}字号不符合要求：当前 {}pt，应为 {}pt",
+                heading_type, font_size, spec.font_size
             )
     
     def _validate_body_paragraph(self, paragraph):
         """验证正文段落格式"""
-        # 验证字体大小
-        font_size = paragraph.runs[0].font.size.pt if paragraph.runs else None
-        if font_size != self.format_spec.body.font_size:
-            self._add_validation_result(
-                "body", paragraph.text[:20] + "...",
-                False,
-                f"正文字号不符合要求：当前 {font_size}pt，应为 {self.format_spec.body.font_size}pt"
-            )
+        self._get_body_checker()(paragraph)
+    
+    def _get_body_checker(self):
+        """
+        生成正文段落检查函数，格式要求在生成时固定为闭包中的常量
+        检查每个段落时不再经过 self.format_spec.body 的属性链，每个验证器只生成一次
+        """
+        if self._body_checker is not None:
+            return self._body_checker
+        
+        body_spec = self.format_spec.body
+        expected_size = body_spec.font_size
+        expected_spacing = body_spec.line_spacing
+        add_result = self._add_validation_result
+        
+        def check_body_paragraph(paragraph):
+            # 验证字体大小
+            font_size = _first_run_font_size(paragraph)
+            if font_size != expected_size:
+                add_result(
+                    "body", paragraph.text[:20] + "...",
+                    False,
+                    "正文字号不符合要求：当前 {}pt，应为 {}pt",
+                    font_size, expected_size
+                )
+            
+            # 验证行距
+            line_spacing = paragraph.paragraph_format.line_spacing
+            if line_spacing != expected_spacing:
+                add_result(
+                    "body", paragraph.text[:20] + "...",
+                    False,
+                    "行距不符合要求：当前 {}，应为 {}",
+                    line_spacing, expected_spacing
+                )
         
-        # 验证行距
-        line_spacing = paragraph.paragraph_format.line_spacing
-        if line_spacing != self.format_spec.body.line_spacing:
-            self._add_validation_result(
-                "body", paragraph.text[:20] + "...",
-                False,
-                f"行距不符合要求：当前 {line_spacing}，应为 {self.format_spec.body.line_spacing}"
-            )
+        self._body_checker = check_body_paragraph
+        return check_body_paragraph
     
     def validate_tables(self):
         """验证表格格式"""
-        tables = self.document.get_tables()
+        tables = self._get_part('tables')
         for i, table in enumerate(tables):
             self._validate_table(table, i+1)
     
     def _validate_table(self, table, table_index):
         """验证单个表格的格式"""
         # 验证表格对齐方式
-        if table.alignment != WD_TABLE_ALIGNMENT.CENTER:
+        if table.alignment != _TBL_CENTER:
             self._add_validation_result(
                 "table", f"Table {table_index}",
                 False,
                 "表格未居中对齐"
             )
         
-        # 验证表头格式
-        if table.rows:
-            header_row = table.rows[0]
-            for cell in header_row.cells:
-                if not cell.paragraphs[0].runs[0].font.bold:
+        # 验证表头格式，直接在XML上检查，不为每个单元格创建段落、run和字体对象
+        tr_lst = table._tbl.tr_lst
+        if tr_lst:
+            for tc in tr_lst[0].tc_lst:
+                if not _is_first_run_bold(tc):
                     self._add_validation_result(
                         "table", f"Table {table_index} header",
                         False,
@@ -173,15 +346,39 @@ class FormatValidator:
     
     def validate_images(self):
         """验证图片格式"""
-        for paragraph in self.document.doc.paragraphs:
-            for run in paragraph.runs:
-                if run._r.xml.find('.//w:drawing') != -1:
-                    self._validate_image_format(paragraph)
+        for paragraph in self._scan_paragraphs()[1]:
+            self._validate_image_format(paragraph)
+    
+    def _scan_paragraphs(self):
+        """
+        一次遍历正文段落，同时收集章节标题段落和包含图片的段落
+        返回 (章节名到第一个同名段落的映射, 包含图片的段落列表)
+        validate_all 执行期间只遍历一次
+        """
+        if self._cache is not None and 'paragraph_scan' in self._cache:
+            return self._cache['paragraph_scan']
+        
+        doc = self.document.doc
+        body = doc._body
+        section_names = self.document.sections
+        headings = {}
+        image_paras = []
+        for p in doc.element.body.iterchildren(_W_P):
+            if next(p.iter(_W_DRAWING), None) is not None:
+                image_paras.append(Paragraph(p, body))
+            text = paragraph_text(p).strip()
+            if text in section_names and text not in headings:
+                headings[text] = Paragraph(p, body)
+        
+        result = (headings, image_paras)
+        if self._cache is not None:
+            self._cache['paragraph_scan'] = result
+        return result
     
     def _validate_image_format(self, paragraph):
         """验证图片段落格式"""
         # 验证对齐方式
-        if paragraph.alignment != WD_PARAGRAPH_ALIGNMENT.CENTER:
+        if paragraph.alignment != _ALIGN_CENTER:
             self._add_validation_result(
                 "image", "alignment",
                 False,
@@ -190,39 +387,38 @@ class FormatValidator:
     
     def validate_page_setup(self):
         """验证页面设置"""
-        section = self.document.doc.sections[0]
+        if 'page_setup' in self._validated:
+            return
+        self._validated.add('page_setup')
+        if self._expected_margins is None:
+            return
         
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
+        section = self._section
+        if section is None:
+            # 文档没有节时无从验证
+            sections = self.document.doc.sections
+            if not len(sections):
+                return
+            section = self._section = sections[0]
         
-        if margin_errors:
+        # 验证页边距，全部正确时不做任何字符串处理
+        mask = _margin_mismatch_mask(section, self._expected_margins)
+        if mask:
             self._add_validation_result(
                 "page_setup", "margins",
                 False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
+                _MARGIN_MSG,
+                _MASK_TO_LABELS[mask]
             )
     
     def _is_main_heading(self, text: str) -> bool:
         """判断是否为一级标题"""
         text = text.strip()
-        return (
-            any(text.startswith(f"{i}. ") for i in range(1, 10)) or
-            any(text.startswith(f"{num}、") for num in ['一', '二', '三', '四', '五', '六', '七', '八', '九']) or
-            text in ['引言', '介绍', '研究方法', '实验', '结果', '讨论', '结论', '参考文献']
-        )
-    
+        return _MAIN_HEADING_RE.match(text) is not None or text in _MAIN_HEADING_SET
     
     def validate_keywords(self):
         """验证关键词格式"""
-        keywords = self.document.get_keywords()
+        keywords = self._get_part('keywords')
         if not keywords:
             self._add_validation_result(
                 "keywords", "existence",
@@ -230,9016 +426,16 @@ class FormatValidator:
             )
             return
         
-        # 验证关键词格式
-        for keyword in keywords:
-            if not keyword.isalnum():
+        # 去掉开头的标签后按分隔符拆分出各个关键词
+        text = _KEYWORDS_LABEL_RE.sub('', keywords.text.strip(), count=1)
+        keyword_list = [k.strip() for k in _KEYWORD_SEP_RE.split(text)]
+        
+        # 验证关键词格式，每个关键词只需一次正则搜索，遇到第一个非法字符即停止
+        search_invalid = _NON_ALNUM_RE.search
+        for keyword in keyword_list:
+            if keyword and search_invalid(keyword):
                 self._add_validation_result(
                     "keywords", keyword,
                     False,
                     "关键词格式不符合要求：必须为字母和数字的组合"
                 )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求��{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-from typing import Dict, List, Optional
-from docx.shared import Pt
-from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
-from .format_spec import DocumentFormat
-
-class FormatValidator:
-    def __init__(self, document, format_spec: DocumentFormat):
-        self.document = document
-        self.format_spec = format_spec
-        self.validation_results = []
-    
-    def validate_all(self) -> List[Dict]:
-        """验证所有格式"""
-        self.validation_results = []
-        
-        # 验证各个部分
-        self.validate_title()
-        self.validate_abstract()
-        self.validate_keywords()
-        self.validate_sections()
-        self.validate_tables()
-        self.validate_images()
-        self.validate_page_setup()
-        
-        return self.validation_results
-    
-    def _add_validation_result(self, section: str, element: str, 
-                             is_valid: bool, message: str):
-        """添加验证结果"""
-        self.validation_results.append({
-            "section": section,
-            "element": element,
-            "is_valid": is_valid,
-            "message": message
-        })
-    
-    def validate_title(self):
-        """验证标题格式"""
-        title = self.document.get_title()
-        if not title:
-            self._add_validation_result(
-                "title", "existence",
-                False, "未找到标题"
-            )
-            return
-        
-        # 验证字体大小
-        font_size = title.runs[0].font.size.pt if title.runs else None
-        if font_size != self.format_spec.title.font_size:
-            self._add_validation_result(
-                "title", "font_size",
-                False,
-                f"标题字号不符合要求：当前 {font_size}pt，应为 {self.format_spec.title.font_size}pt"
-            )
-        
-        # 验证对齐方式
-        alignment_map = {
-            WD_PARAGRAPH_ALIGNMENT.CENTER: "CENTER",
-            WD_PARAGRAPH_ALIGNMENT.LEFT: "LEFT",
-            WD_PARAGRAPH_ALIGNMENT.RIGHT: "RIGHT",
-            WD_PARAGRAPH_ALIGNMENT.JUSTIFY: "JUSTIFY"
-        }
-        current_alignment = alignment_map.get(title.alignment)
-        if current_alignment != self.format_spec.title.alignment:
-            self._add_validation_result(
-                "title", "alignment",
-                False,
-                f"标题对齐方式不符合要求：当前为 {current_alignment}，应为 {self.format_spec.title.alignment}"
-            )
-    
-    def validate_abstract(self):
-        """验证摘要格式"""
-        abstract = self.document.get_abstract()
-        if not abstract:
-            self._add_validation_result(
-                "abstract", "existence",
-                False, "未找到摘要"
-            )
-            return
-        
-        # 验证缩进
-        indent = abstract.paragraph_format.first_line_indent
-        if indent:
-            current_indent = indent.pt
-            if current_indent != self.format_spec.abstract.first_line_indent:
-                self._add_validation_result(
-                    "abstract", "indent",
-                    False,
-                    f"摘要首行缩进不符合要求：当前 {current_indent}pt，应为 {self.format_spec.abstract.first_line_indent}pt"
-                )
-    
-    def validate_sections(self):
-        """验证章节格式"""
-        sections = self.document.get_all_sections()
-        for section_name, paragraphs in sections.items():
-            # 验证章节标题
-            if section_name in self.document.sections:
-                section_para = next((p for p in self.document.doc.paragraphs 
-                                 if p.text.strip() == section_name), None)
-                if section_para:
-                    self._validate_heading(section_para, section_name)
-            
-            # 验证正文段落
-            for para in paragraphs:
-                self._validate_body_paragraph(para)
-    
-    def _validate_heading(self, paragraph, heading_text):
-        """验证标题格式"""
-        # 判断标题级别
-        if self._is_main_heading(heading_text):
-            spec = self.format_spec.heading1
-            heading_type = "一级标题"
-        else:
-            spec = self.format_spec.heading2
-            heading_type = "二级标题"
-        
-        # 验证字体大小
-        font_size = paragraph.runs[0].font.size.pt if paragraph.runs else None
-        if font_size != spec.font_size:
-            self._add_validation_result(
-                "heading", heading_text,
-                False,
-                f"{heading_type}字号不符合要求：当前 {font_size}pt，应为 {spec.font_size}pt"
-            )
-    
-    def _validate_body_paragraph(self, paragraph):
-        """验证正文段落格式"""
-        # 验证字体大小
-        font_size = paragraph.runs[0].font.size.pt if paragraph.runs else None
-        if font_size != self.format_spec.body.font_size:
-            self._add_validation_result(
-                "body", paragraph.text[:20] + "...",
-                False,
-                f"正文字号不符合要求：当前 {font_size}pt，应为 {self.format_spec.body.font_size}pt"
-            )
-        
-        # 验证行距
-        line_spacing = paragraph.paragraph_format.line_spacing
-        if line_spacing != self.format_spec.body.line_spacing:
-            self._add_validation_result(
-                "body", paragraph.text[:20] + "...",
-                False,
-                f"行距不符合要求：当前 {line_spacing}，应为 {self.format_spec.body.line_spacing}"
-            )
-    
-    def validate_tables(self):
-        """验证表格格式"""
-        tables = self.document.get_tables()
-        for i, table in enumerate(tables):
-            self._validate_table(table, i+1)
-    
-    def _validate_table(self, table, table_index):
-        """验证单个表格的格式"""
-        # 验证表格对齐方式
-        if table.alignment != WD_TABLE_ALIGNMENT.CENTER:
-            self._add_validation_result(
-                "table", f"Table {table_index}",
-                False,
-                "表格未居中对齐"
-            )
-        
-        # 验证表头格式
-        if table.rows:
-            header_row = table.rows[0]
-            for cell in header_row.cells:
-                if not cell.paragraphs[0].runs[0].font.bold:
-                    self._add_validation_result(
-                        "table", f"Table {table_index} header",
-                        False,
-                        "表头未加粗"
-                    )
-                    break
-    
-    def validate_images(self):
-        """验证图片格式"""
-        for paragraph in self.document.doc.paragraphs:
-            for run in paragraph.runs:
-                if run._r.xml.find('.//w:drawing') != -1:
-                    self._validate_image_format(paragraph)
-    
-    def _validate_image_format(self, paragraph):
-        """验证图片段落格式"""
-        # 验证对齐方式
-        if paragraph.alignment != WD_PARAGRAPH_ALIGNMENT.CENTER:
-            self._add_validation_result(
-                "image", "alignment",
-                False,
-                "图片未居中对齐"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def _is_main_heading(self, text: str) -> bool:
-        """判断是否为一级标题"""
-        text = text.strip()
-        return (
-            any(text.startswith(f"{i}. ") for i in range(1, 10)) or
-            any(text.startswith(f"{num}、") for num in ['一', '二', '三', '四', '五', '六', '七', '八', '九']) or
-            text in ['引言', '介绍', '研究方法', '实验', '结果', '讨论', '结论', '参考文献']
-        )
-    
-    def validate_keywords(self):
-        """验证关键词格式"""
-        keywords = self.document.get_keywords()
-        if not keywords:
-            self._add_validation_result(
-                "keywords", "existence",
-                False, "未找到关键词"
-            )
-            return
-        
-        # 验证关键词格式
-        for keyword in keywords:
-            if not keyword.isalnum():
-                self._add_validation_result(
-                    "keywords", keyword,
-                    False,
-                    "关键词格式不符合要求：必须为字母和数字的组合"
-                )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        # 验证页边距
-        margin_errors = []
-        if section.top_margin.pt != self.format_spec.page_setup.margin_top:
-            margin_errors.append("上边距")
-        if section.bottom_margin.pt != self.format_spec.page_setup.margin_bottom:
-            margin_errors.append("下边距")
-        if section.left_margin.pt != self.format_spec.page_setup.margin_left:
-            margin_errors.append("左边距")
-        if section.right_margin.pt != self.format_spec.page_setup.margin_right:
-            margin_errors.append("右边距")
-        
-        if margin_errors:
-            self._add_validation_result(
-                "page_setup", "margins",
-                False,
-                f"页边距不符合要求：{', '.join(margin_errors)}不正确"
-            )
-    
-    def validate_page_setup(self):
-        """验证页面设置"""
-        section = self.document.doc.sections[0]
-        
-        ) 
\ No newline at end of file
@@ -6,10 +6,11 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from PyQt6.QtWidgets import QApplication
-from src.gui.main_window import MainWindow  # 使用绝对导入
 
 def run():
     app = QApplication(sys.argv)
+    # QApplication 创建之后再导入主窗口
+    from src.gui.main_window import MainWindow  # 使用绝对导入
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
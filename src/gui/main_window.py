@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QStackedWidget, 
-    QToolBar, QStatusBar, QMessageBox, QToolButton, QPushButton
+    QToolBar, QStatusBar, QMessageBox, QToolButton, QPushButton,
+    QApplication
 )
 from PyQt6.QtGui import QAction, QIcon
 from PyQt6.QtCore import Qt
@@ -9,13 +10,13 @@ from pathlib import Path
 from src.gui.pages.document_page import DocumentPage
 from src.gui.pages.format_page import FormatPage
 from src.gui.pages.preview_page import PreviewPage
-from src.config.config_manager import ConfigManager
+from src.config.config_manager import get_config_manager
 
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         # 初始化配置管理器
-        self.config_manager = ConfigManager()
+        self.config_manager = get_config_manager()
         
         # 初始化数据
         self.document = None
@@ -25,10 +26,11 @@ class MainWindow(QMainWindow):
         self.document_uploaded = False
         self.format_configured = False
         
-        # 设置应用图标
-        icon_path = Path(__file__).parent.parent / "resources" / "icons" / "app_icon.ico"
-        if icon_path.exists():
-            self.setWindowIcon(QIcon(str(icon_path)))
+        # 设置应用图标（若启动脚本已设置应用图标则直接沿用，不再重复加载）
+        if QApplication.windowIcon().isNull():
+            icon_path = Path(__file__).parent.parent / "resources" / "icons" / "app_icon.ico"
+            if icon_path.exists():
+                self.setWindowIcon(QIcon(str(icon_path)))
         
         # 初始化界面
         self.init_ui()
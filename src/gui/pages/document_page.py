@@ -2,9 +2,9 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QPushButton, 
     QFileDialog, QScrollArea, QLabel,
-    QHBoxLayout, QFrame, QApplication
+    QHBoxLayout, QFrame
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QPixmap, QImage
 from pathlib import Path
 import tempfile
@@ -14,14 +14,32 @@ import pythoncom
 import fitz  # PyMuPDF
 from src.core.document import Document
 from src.core.formatter import WordFormatter
-from src.config.config_manager import ConfigManager
+from src.config.config_manager import get_config_manager
 from src.gui.components.loading_indicator import LoadingIndicator
 
+class DocumentLoadWorker(QThread):
+    """后台加载文档的工作线程，文档解析（包括AI分析）不阻塞界面"""
+    loaded = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+    def __init__(self, file_path, config_manager):
+        super().__init__()
+        self.file_path = file_path
+        self.config_manager = config_manager
+
+    def run(self):
+        try:
+            document = Document(self.file_path, self.config_manager)
+            self.loaded.emit(document)
+        except Exception as e:
+            self.error.emit(str(e))
+
 class DocumentPage(QWidget):
     def __init__(self, main_window):
         super().__init__()
         self.main_window = main_window
-        self.config_manager = ConfigManager()
+        self.config_manager = get_config_manager()
+        self.load_worker = None
         self.temp_dir = tempfile.mkdtemp()
         self.last_directory = self.config_manager.get('last_directory', str(Path.home()))  # 获取上次目录
         self.init_ui()
@@ -117,18 +135,32 @@ class DocumentPage(QWidget):
 
     def process_document(self, file_path):
         """处理文档"""
+        # 上一个文档仍在加载时忽略新的请求
+        if self.load_worker and self.load_worker.isRunning():
+            return
+        
         try:
             # 显示加载动画
             self.loading_indicator.show()
             self.loading_indicator.start()
-            QApplication.processEvents()
             
             # 保存当前目录
             self.last_directory = str(Path(file_path).parent)
             self.config_manager.set('last_directory', self.last_directory)
             
-            # 加载文档
-            self.main_window.document = Document(file_path, self.config_manager)
+            # 在后台线程中加载文档
+            self.load_worker = DocumentLoadWorker(file_path, self.config_manager)
+            self.load_worker.loaded.connect(self.on_document_loaded)
+            self.load_worker.error.connect(self.on_document_load_failed)
+            self.load_worker.start()
+            
+        except Exception as e:
+            self.on_document_load_failed(str(e))
+    
+    def on_document_loaded(self, document):
+        """文档加载完成"""
+        try:
+            self.main_window.document = document
             self.main_window.formatter = WordFormatter(
                 self.main_window.document, 
                 self.config_manager
@@ -137,7 +169,7 @@ class DocumentPage(QWidget):
             # 更新状态
             self.main_window.set_document_uploaded(True)
             self.main_window.update_toolbar_state()
-            self.main_window.show_message(f"已加载文档: {Path(file_path).name}")
+            self.main_window.show_message(f"已加载文档: {Path(document.path).name}")
             
             # 自动切换到格式设置页面
             self.main_window.show_format_page()
@@ -148,6 +180,12 @@ class DocumentPage(QWidget):
             self.loading_indicator.stop()
             self.loading_indicator.hide()
     
+    def on_document_load_failed(self, error_msg):
+        """文档加载失败"""
+        self.loading_indicator.stop()
+        self.loading_indicator.hide()
+        self.main_window.show_message(f"加载文档失败: {error_msg}", error=True)
+    
     def convert_word_to_pdf(self, docx_path, pdf_path):
         """将Word文档转换为PDF"""
         pythoncom.CoInitialize()
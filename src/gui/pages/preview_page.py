@@ -476,18 +476,16 @@ class PreviewPage(QWidget):
             
             # 复制和格式化文档
             try:
-                # 直接使用python-docx打开原始文档
-                from docx import Document
+                # 使用已加载到内存中的原始文档数据，不再重复读取文件
+                document = self.main_window.document
                 
-                # 打开原始文档
                 try:
                     # 先保存原始文档
-                    original_doc = Document(self.main_window.document.path)
-                    original_doc.save(original_docx)
+                    document.save_original(original_docx)
                     print("原始文档保存成功")
                     
                     # 创建格式化文档的副本
-                    formatted_doc = Document(self.main_window.document.path)
+                    formatted_doc = document.open_original()
                     
                     # 应用格式
                     formatter = self.main_window.formatter
@@ -0,0 +1,21 @@
+"""JSON读写辅助函数，安装了orjson时使用orjson加速，否则使用标准库json"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj) -> bytes:
+    """序列化为带缩进的UTF-8编码JSON字节串"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def loads(data):
+    """从字节串或字符串解析JSON"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)